@@ -13,8 +13,10 @@
 # limitations under the License.
 import operator
 import re
+from functools import lru_cache
+from itertools import repeat
 from types import NoneType, UnionType
-from typing import Any, Final, Sequence, get_args
+from typing import Any, Callable, Final, Sequence, get_args
 
 from renda._exceptions import _CheckError
 from renda._messages import _BUG_MESSAGE
@@ -28,8 +30,13 @@ def _check_seed(seed: int | None) -> int | None:
     # We want all check functions to come from this module
     from renda.seeding import MAX_SEED, MIN_SEED
 
+    # Fast path for valid seeds (`type() is int` excludes subclasses like `bool`,
+    # which, like any other case, take the full path below)
+    if seed is None or (type(seed) is int and MIN_SEED <= seed <= MAX_SEED):
+        return seed
+
     return _check_scalar(
-        scalar=seed,
+        seed,
         type_=int | None,
         name="seed",
         ge=MIN_SEED,
@@ -43,6 +50,17 @@ def _check_seed(seed: int | None) -> int | None:
 # The second argument of `isinstance()` must be of this type
 __TYPE_TYPE = type | UnionType | tuple[Any, ...]
 
+# Messages of known `TypeError`s raised by incorrect uses of the operators
+__NOT_SUPPORTED_ERROR_PATTERN: Final = re.compile(
+    "^'.*' not supported between instances of '.*' and '.*'$"
+)
+__NOT_ITERABLE_ERROR_PATTERN: Final = re.compile(
+    "^argument of type '.*' is not iterable$"
+)
+
+# Operators bound to their arguments as `(op_key, op_symbol, op, op_arg)`
+__BOUND_OPERATORS_TYPE = tuple[tuple[str, str, Callable[[Any, Any], bool], Any], ...]
+
 
 def _check_scalar(
     scalar: Any,
@@ -50,41 +68,100 @@ def _check_scalar(
     name: str = "scalar",
     **operators: Any,
 ) -> Any:
+    # Fast path for the most common use: a plain type, no operators, and a scalar
+    # satisfying the type condition (any other case takes the full path below)
+    if (
+        len(operators) == 0
+        and isinstance(type_, type)
+        and isinstance(name, str)
+        and isinstance(scalar, type_)
+    ):
+        return scalar
+
+    type_ = __check_type_arg(type_)
+    name = __check_name_arg(name)
+    operators = __check_operators_arg(operators)
+
+    _, check_error_messages = __check_scalar_conditions(
+        scalar=scalar,
+        type_=type_,
+        name=name,
+        bound_operators=__bind_operators(operators),
+    )
+
+    if len(check_error_messages) > 0:
+        raise _CheckError("".join(check_error_messages))
+
+    return scalar
+
+
+def _make_check_scalar(
+    type_: __TYPE_TYPE,
+    name: str = "scalar",
+    **operators: Any,
+) -> Callable[[Any], Any]:
+    # Returns a function equivalent to `_check_scalar` with fixed `type_`, `name`,
+    # and `operators`, which are only checked (and bound) once
     type_ = __check_type_arg(type_)
     name = __check_name_arg(name)
     operators = __check_operators_arg(operators)
+    bound_operators = __bind_operators(operators)
+    type_includes_none = __type_includes_none(type_)
+    type_str = __get_type_str(type_)
+
+    def check_scalar(scalar: Any) -> Any:
+        _, check_error_messages = __check_scalar_conditions(
+            scalar=scalar,
+            type_=type_,
+            name=name,
+            bound_operators=bound_operators,
+            type_includes_none=type_includes_none,
+            type_str=type_str,
+        )
+
+        if len(check_error_messages) > 0:
+            raise _CheckError("".join(check_error_messages))
 
-    if scalar is None and __type_includes_none(type_):
         return scalar
 
-    check_error_message = ""
+    return check_scalar
+
+
+def __check_scalar_conditions(
+    scalar: Any,
+    type_: __TYPE_TYPE,
+    name: str,
+    bound_operators: __BOUND_OPERATORS_TYPE,
+    type_includes_none: bool | None = None,
+    type_str: str | None = None,
+) -> tuple[bool, list[str]]:
+    # All arguments except `scalar` are assumed to be checked already
+    # `type_includes_none` and `type_str` are derived from `type_` unless passed
+    # Returns whether the type condition is satisfied and the check error messages
+    if scalar is None:
+        if type_includes_none is None:
+            type_includes_none = __type_includes_none(type_)
+        if type_includes_none:
+            return True, []
+
+    check_error_messages: list[str] = []
 
     # ---------------------
     # Check type condition
     # ---------------------
     type_condition_not_satisfied = not isinstance(scalar, type_)
     if type_condition_not_satisfied:
-        type_str = __get_type_str(type_)
-        check_error_message = (
-            f"{check_error_message}\n"
-            f"  - `{name}` must be of type {type_str}, got `{scalar}` of "
+        if type_str is None:
+            type_str = __get_type_str(type_)
+        check_error_messages.append(
+            f"\n  - `{name}` must be of type {type_str}, got `{scalar}` of "
             f"type `{type(scalar).__qualname__}`"
         )
 
     # --------------------------
     # Check operator conditions
     # --------------------------
-    for op_key, op_arg in operators.items():
-        op_symbol = __SUPPORTED_OPERATORS[op_key]
-
-        # Get operator
-        if op_key == "in_":
-            op = lambda a, b: operator.contains(b, a)  # noqa: E731
-        elif op_key == "not_in":
-            op = lambda a, b: not operator.contains(b, a)  # noqa: E731
-        else:
-            op = getattr(operator, op_key)
-
+    for op_key, op_symbol, op, op_arg in bound_operators:
         try:
             op_condition_not_satisfied = not op(scalar, op_arg)
         except TypeError as e:
@@ -98,16 +175,14 @@ def _check_scalar(
 
                 # Known incorrect use :/
                 if op_key in ("ge", "gt", "le", "lt"):
-                    pattern = "^'.*' not supported between instances of '.*' and '.*'$"
-                    if re.match(pattern, str(e)):
+                    if __NOT_SUPPORTED_ERROR_PATTERN.match(str(e)):
                         raise TypeError(
                             f"`{op_symbol}` (`{op_key}`) not supported between "
                             f"instances of `{type(scalar).__qualname__}` and "
                             f"`{type(op_arg).__qualname__}`{_BUG_MESSAGE}"
                         )
                 elif op_key in ("in_", "not_in"):
-                    pattern = "^argument of type '.*' is not iterable$"
-                    if re.match(pattern, str(e)):
+                    if __NOT_ITERABLE_ERROR_PATTERN.match(str(e)):
                         raise TypeError(
                             f"`{op_key}` must be iterable, got `{op_arg}`"
                             f"{_BUG_MESSAGE}"
@@ -117,15 +192,11 @@ def _check_scalar(
                 raise TypeError(f"{e}{_BUG_MESSAGE}")  # pragma: no cover
 
         if op_condition_not_satisfied:
-            check_error_message = (
-                f"{check_error_message}\n"
-                f"  - `{name} {op_symbol} {op_arg}` not satisfied, got `{scalar}`"
+            check_error_messages.append(
+                f"\n  - `{name} {op_symbol} {op_arg}` not satisfied, got `{scalar}`"
             )
 
-    if len(check_error_message) > 0:
-        raise _CheckError(check_error_message)
-
-    return scalar
+    return not type_condition_not_satisfied, check_error_messages
 
 
 def _check_sequence(
@@ -140,40 +211,41 @@ def _check_sequence(
     length = __check_length_arg(length)
     operators = __check_operators_arg(operators)
 
-    check_error_message = ""
+    check_error_messages: list[str] = []
+    elements_check_error_messages: list[str] = []
+
+    if __is_sequence(sequence):
+        # -------------------------------------------------------------
+        # Check length condition / element type and operator conditions
+        # -------------------------------------------------------------
+        # The element types are checked in the same pass as the operators
+        (
+            type_condition_satisfied,
+            elements_check_error_messages,
+        ) = __check_sequence_length_and_elements(
+            sequence=sequence,
+            type_=type_,
+            name=name,
+            length=length,
+            bound_operators=__bind_operators(operators),
+        )
+    else:
+        type_condition_satisfied = False
 
     # ---------------------
     # Check type condition
     # ---------------------
-    type_condition_not_satisfied = not (
-        isinstance(sequence, Sequence)
-        and all(isinstance(element, type_) for element in sequence)
-    )
-    if type_condition_not_satisfied:
+    if not type_condition_satisfied:
         type_str = __get_type_str(type_)
-        check_error_message = (
-            f"{check_error_message}\n"
-            f"  - `{name}` must be a sequence with elements of type "
+        check_error_messages.append(
+            f"\n  - `{name}` must be a sequence with elements of type "
             f"{type_str}, got `{sequence}`"
         )
 
-    if isinstance(sequence, Sequence):
-        # ---------------------------------------------
-        # Check length condition / operator conditions
-        # ---------------------------------------------
-        try:
-            __check_sequence_length_and_elements(
-                sequence=sequence,
-                type_=type_,
-                name=name,
-                length=length,
-                **operators,
-            )
-        except _CheckError as e:
-            check_error_message = f"{check_error_message}{e}"
+    check_error_messages.extend(elements_check_error_messages)
 
-    if len(check_error_message) > 0:
-        raise _CheckError(check_error_message)
+    if len(check_error_messages) > 0:
+        raise _CheckError("".join(check_error_messages))
 
     return sequence
 
@@ -181,39 +253,47 @@ def _check_sequence(
 def __check_sequence_length_and_elements(
     sequence: Sequence[Any],
     type_: __TYPE_TYPE,
-    name: str = "sequence",
-    length: int | None = None,
-    **operators: Any,
-) -> Sequence[Any]:
-    check_error_message = ""
+    name: str,
+    length: int | None,
+    bound_operators: __BOUND_OPERATORS_TYPE,
+) -> tuple[bool, list[str]]:
+    # All arguments except `sequence` are assumed to be checked already
+    # Returns whether the type condition is satisfied by all elements and the
+    # check error messages
+    check_error_messages: list[str] = []
 
     # -----------------------
     # Check length condition
     # -----------------------
     if length is not None and len(sequence) != length:
-        check_error_message = (
-            f"{check_error_message}\n  - `{name}` must have length "
+        check_error_messages.append(
+            f"\n  - `{name}` must have length "
             f"`{length}`, but `len({name}) = {len(sequence)}`"
         )
 
-    # --------------------------
-    # Check operator conditions
-    # --------------------------
-    for index, scalar in enumerate(sequence):
-        try:
-            _check_scalar(
-                scalar=scalar,
-                type_=type_,
-                name=f"{name}[{index}]",  # Clearly indicate element-level check
-                **operators,
-            )
-        except _CheckError as e:
-            check_error_message = f"{check_error_message}{e}"
+    # ------------------------------------------
+    # Check element type / operator conditions
+    # ------------------------------------------
+    # Fast path for the most common use: no operators and all elements satisfying
+    # the type condition (checked in a C-level loop)
+    if len(bound_operators) == 0 and all(map(isinstance, sequence, repeat(type_))):
+        return True, check_error_messages
 
-    if len(check_error_message) > 0:
-        raise _CheckError(check_error_message)
+    type_condition_satisfied = True
+    for index, scalar in enumerate(sequence):
+        (
+            element_type_condition_satisfied,
+            element_check_error_messages,
+        ) = __check_scalar_conditions(
+            scalar=scalar,
+            type_=type_,
+            name=f"{name}[{index}]",  # Clearly indicate element-level check
+            bound_operators=bound_operators,
+        )
+        type_condition_satisfied &= element_type_condition_satisfied
+        check_error_messages.extend(element_check_error_messages)
 
-    return sequence
+    return type_condition_satisfied, check_error_messages
 
 
 def _check_scalar_or_sequence(
@@ -228,66 +308,66 @@ def _check_scalar_or_sequence(
     length = __check_length_arg(length)
     operators = __check_operators_arg(operators)
 
-    check_error_message = ""
+    check_error_messages: list[str] = []
+
+    if __is_sequence(scalar_or_sequence):
+        # -------------------------------------------------------------
+        # Check length condition / element type and operator conditions
+        # -------------------------------------------------------------
+        # The element types are checked in the same pass as the operators
+        (
+            elements_type_condition_satisfied,
+            other_check_error_messages,
+        ) = __check_sequence_length_and_elements(
+            sequence=scalar_or_sequence,
+            type_=type_,
+            name=name,
+            length=length,
+            bound_operators=__bind_operators(operators),
+        )
+    else:
+        # --------------------------------
+        # Check scalar operator conditions
+        # --------------------------------
+        # The type condition is checked below
+        # So instead of the desired type, we pass the actual type
+        elements_type_condition_satisfied = False
+        _, other_check_error_messages = __check_scalar_conditions(
+            scalar=scalar_or_sequence,
+            type_=type(scalar_or_sequence),
+            name=name,
+            bound_operators=__bind_operators(operators),
+        )
 
     # ---------------------
     # Check type condition
     # ---------------------
-    type_condition_not_satisfied = not (
-        isinstance(scalar_or_sequence, type_)
-        or isinstance(scalar_or_sequence, Sequence)
-        and all(isinstance(element, type_) for element in scalar_or_sequence)
+    type_condition_satisfied = (
+        isinstance(scalar_or_sequence, type_) or elements_type_condition_satisfied
     )
-    if type_condition_not_satisfied:
+    if not type_condition_satisfied:
         type_str = __get_type_str(type_)
-        check_error_message = (
-            f"{check_error_message}\n"
-            f"  - `{name}` must be of type {type_str}, or a sequence with "
+        check_error_messages.append(
+            f"\n  - `{name}` must be of type {type_str}, or a sequence with "
             f"elements of type {type_str}, got `{scalar_or_sequence}`"
         )
 
-    if isinstance(scalar_or_sequence, Sequence):
-        # ---------------------------------------------
-        # Check length condition / operator conditions
-        # ---------------------------------------------
-        try:
-            # We don't want to check the type again
-            # So instead of _check_sequence, we call its helper function
-            __check_sequence_length_and_elements(
-                sequence=scalar_or_sequence,
-                type_=type_,
-                name=name,
-                length=length,
-                **operators,
-            )
-        except _CheckError as e:
-            check_error_message = f"{check_error_message}{e}"
-    else:
-        # -------------
-        # Check scalar
-        # -------------
-        try:
-            # We don't want to check the type again
-            # So instead of the desired type, we pass the actual type
-            _check_scalar(
-                scalar=scalar_or_sequence,
-                type_=type(scalar_or_sequence),
-                name=name,
-                **operators,
-            )
-        except _CheckError as e:
-            check_error_message = f"{check_error_message}{e}"
+    check_error_messages.extend(other_check_error_messages)
 
-    if len(check_error_message) > 0:
-        raise _CheckError(check_error_message)
+    if len(check_error_messages) > 0:
+        raise _CheckError("".join(check_error_messages))
 
     return scalar_or_sequence
 
 
 def __check_type_arg(type_: __TYPE_TYPE) -> __TYPE_TYPE:
     try:
-        isinstance(object(), type_)
+        is_type_arg = __is_type_arg_cached(type_)
     except TypeError:
+        # Not hashable (e.g. a tuple containing a list), so probe it directly
+        is_type_arg = __is_type_arg(type_)
+
+    if not is_type_arg:
         raise TypeError(
             f"`type_` must be a type, a tuple of types, or a union, got `{type_}`"
         )
@@ -295,6 +375,18 @@ def __check_type_arg(type_: __TYPE_TYPE) -> __TYPE_TYPE:
     return type_
 
 
+def __is_type_arg(type_: Any) -> bool:
+    try:
+        isinstance(object(), type_)
+    except TypeError:
+        return False
+
+    return True
+
+
+__is_type_arg_cached = lru_cache(maxsize=256)(__is_type_arg)
+
+
 def __check_name_arg(name: str) -> str:
     if not isinstance(name, str):
         raise TypeError(f"`name` must be a `str`, got `{name}`")
@@ -309,22 +401,28 @@ def __check_length_arg(length: int | None) -> int | None:
     return length
 
 
-__SUPPORTED_OPERATORS: Final = {
-    "ge": ">=",
-    "gt": ">",
-    "le": "<=",
-    "lt": "<",
-    "eq": "==",
-    "ne": "!=",
-    "in_": "in",
-    "not_in": "not in",
+# Maps each supported operator keyword to its symbol and its function
+__OPERATORS: Final = {
+    "ge": (">=", operator.ge),
+    "gt": (">", operator.gt),
+    "le": ("<=", operator.le),
+    "lt": ("<", operator.lt),
+    "eq": ("==", operator.eq),
+    "ne": ("!=", operator.ne),
+    "in_": ("in", lambda a, b: operator.contains(b, a)),
+    "not_in": ("not in", lambda a, b: not operator.contains(b, a)),
 }
+__SUPPORTED_OPERATORS_STR: Final = "`, `".join(__OPERATORS.keys())
 
 
 def __check_operators_arg(operators: dict[str, Any]) -> dict[str, Any]:
+    # Most checks are called without operators
+    if len(operators) == 0:
+        return operators
+
     unsupported_operators = []
     for op_key in operators.keys():
-        if op_key not in __SUPPORTED_OPERATORS.keys():
+        if op_key not in __OPERATORS.keys():
             unsupported_operators.append(op_key)
 
     if len(unsupported_operators) > 0:
@@ -332,28 +430,46 @@ def __check_operators_arg(operators: dict[str, Any]) -> dict[str, Any]:
             f"unsupported operator keyword(s) "
             f"`{'`, `'.join(unsupported_operators)}`, "
             f"supported operator keywords are "
-            f"`{'`, `'.join(__SUPPORTED_OPERATORS.keys())}`"
+            f"`{__SUPPORTED_OPERATORS_STR}`"
         )
 
     return operators
 
 
-def __type_includes_none(type_: __TYPE_TYPE) -> bool:
-    return (
-        type_ is NoneType
-        or (isinstance(type_, tuple) and NoneType in type_)
-        or (isinstance(type_, UnionType) and NoneType in get_args(type_))
+def __bind_operators(operators: dict[str, Any]) -> __BOUND_OPERATORS_TYPE:
+    return tuple(
+        (op_key, *__OPERATORS[op_key], op_arg) for op_key, op_arg in operators.items()
     )
 
 
-def __get_type_str(type_: __TYPE_TYPE) -> str:
+def __is_sequence(obj: Any) -> bool:
+    # Checking the exact type first skips the (slower) ABC check for the most
+    # common sequences
+    return type(obj) is list or type(obj) is tuple or isinstance(obj, Sequence)
+
+
+def __get_type_members(type_: __TYPE_TYPE) -> tuple[Any, ...]:
+    # The types that `type_` is made of, in order
+    # Not cached, as unions with the same members in a different order are equal
+    # (and hash the same), so a cache would return the order seen first
     if isinstance(type_, type):
-        return f"`{type_.__qualname__}`"
-    else:
-        if not isinstance(type_, tuple):
-            type_ = get_args(type_)
+        return (type_,)
+    if isinstance(type_, tuple):
+        return type_
+
+    return get_args(type_)
+
 
+def __type_includes_none(type_: __TYPE_TYPE) -> bool:
+    return NoneType in __get_type_members(type_)
+
+
+def __get_type_str(type_: __TYPE_TYPE) -> str:
+    type_members = __get_type_members(type_)
+    if len(type_members) == 1:
+        return f"`{type_members[0].__qualname__}`"
+    else:
         return (
-            f"{', '.join(f'`{t.__qualname__}`' for t in type_[:-1])} or "
-            f"`{type_[-1].__qualname__}`"
+            f"{', '.join(f'`{t.__qualname__}`' for t in type_members[:-1])} or "
+            f"`{type_members[-1].__qualname__}`"
         )
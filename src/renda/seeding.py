@@ -12,46 +12,82 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import random
-from typing import Any, Final, Iterable
-
-import numpy as np
-import torch
+from functools import cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Final, Iterable
 
 from renda._checks import _check_seed
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    import torch
+
+
 MIN_SEED: Final[int] = 0
 MAX_SEED: Final[int] = 4294967295  # 2^32 - 1 (uint32)
 
 
+@cache
+def _import_numpy_and_torch() -> tuple[ModuleType, ModuleType]:
+    # Import lazily, importing (especially) torch is slow
+    # Only needed once a `temp_seed` context is actually entered
+    import numpy
+    import torch
+
+    return numpy, torch
+
+
+@cache
+def _cuda_is_available() -> bool:
+    # Evaluated once, so CPU-only systems never touch the CUDA RNG
+    _, torch = _import_numpy_and_torch()
+    return torch.cuda.is_available()
+
+
 class temp_seed:
+    __slots__ = (
+        "_seed",
+        "_random_state",
+        "_np_random_state",
+        "_torch_rng_state",
+        "_torch_cuda_rng_state_all",
+    )
+
     _seed: int | None
     _random_state: tuple[Any, ...]
     _np_random_state: dict[str, Any]
-    _torch_rng_state: torch.Tensor
-    _torch_cuda_rng_state_all: Iterable[torch.Tensor]
+    _torch_rng_state: "torch.Tensor"
+    _torch_cuda_rng_state_all: Iterable["torch.Tensor"]
 
     def __init__(self, seed: int | None) -> None:
         self._seed = _check_seed(seed)
 
     def __enter__(self) -> None:  # pragma: no cover
         if self._seed is not None:
+            np, torch = _import_numpy_and_torch()
+
             # Store random states
             self._random_state = random.getstate()
-            self._np_random_state = np.random.get_state()
+            # Plain bit generator state (matches `set_state`, skips the legacy tuple)
+            self._np_random_state = np.random.get_state(legacy=False)
             self._torch_rng_state = torch.get_rng_state()
-            self._torch_cuda_rng_state_all = torch.cuda.get_rng_state_all()
+            if _cuda_is_available():
+                self._torch_cuda_rng_state_all = torch.cuda.get_rng_state_all()
 
             # Seed everything
             random.seed(self._seed)
             np.random.seed(self._seed)
             torch.manual_seed(self._seed)
-            torch.cuda.manual_seed_all(self._seed)
+            if _cuda_is_available():
+                torch.cuda.manual_seed_all(self._seed)
 
     def __exit__(self, exc_type, exc_value, traceback) -> None:  # pragma: no cover
         if self._seed is not None:
+            np, torch = _import_numpy_and_torch()
+
             # Restore random states
             random.setstate(self._random_state)
             np.random.set_state(self._np_random_state)
             torch.set_rng_state(self._torch_rng_state)
-            torch.cuda.set_rng_state_all(self._torch_cuda_rng_state_all)
+            if _cuda_is_available():
+                torch.cuda.set_rng_state_all(self._torch_cuda_rng_state_all)
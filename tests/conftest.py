@@ -16,6 +16,10 @@ import pytest
 from renda.seeding import MAX_SEED, MIN_SEED
 
 
+def _zero():
+    return 0
+
+
 @pytest.fixture(
     scope="session",
     params=(
@@ -23,14 +27,14 @@ from renda.seeding import MAX_SEED, MIN_SEED
         MIN_SEED - 1,
         MAX_SEED + 1,
         "zero",
-        lambda: 0,
+        _zero,
     ),
     ids=(
         "0.0",
         "MIN_SEED - 1",
         "MAX_SEED + 1",
         "zero",
-        "lambda: 0",
+        "_zero",
     ),
 )
 def non_seed(request):
@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import OrderedDict
+import re
 from types import NoneType
+from typing import Any, Callable, Union
 
 import pytest
 
@@ -21,11 +22,41 @@ from renda._checks import (
     _check_scalar_or_sequence,
     _check_seed,
     _check_sequence,
+    _make_check_scalar,
 )
 from renda._exceptions import _CheckError
 from renda.seeding import MAX_SEED, MIN_SEED
 
 
+# Type arguments shared by several test parameters
+__INT_OR_NONE = int | None
+__INT_OR_NONETYPE = (int, NoneType)
+__BOOL_OR_FLOAT = bool | float
+
+# Patterns to match error messages shared by several tests
+__SCALAR_TYPE_MATCH = re.compile("`scalar` must be of type `.*`, got `.*` of type `.*`")
+__TYPE_ARG_INVALID_MATCH = re.compile(
+    "^`type_` must be a type, a tuple of types, or a union, got `.*`$"
+)
+__NAME_ARG_INVALID_MATCH = re.compile("^`name` must be a `str`, got `.*`$")
+__LENGTH_ARG_INVALID_MATCH = re.compile(
+    "^`length` must be a positive `int` or `None`, got `.*`$"
+)
+__OPERATORS_UNSUPPORTED_MATCH = re.compile(
+    "^unsupported operator keyword\\(s\\) `foo`, `bar`"
+)
+__SEQUENCE_TYPE_MATCH = re.compile(
+    "`sequence` must be a sequence with elements of type `.*`, got `.*`"
+)
+__SCALAR_OR_SEQUENCE_TYPE_MATCH = re.compile(
+    "`scalar_or_sequence` must be of type `.*`, or a sequence"
+)
+__OPERATOR_NOT_SUPPORTED_MATCH = re.compile(
+    "^`.{1,6}` \\(`.{2,6}`\\) not supported between instances of `.*` and `.*`"
+)
+__OPERATOR_NOT_ITERABLE_MATCH = re.compile("^`.{2,6}` must be iterable, got `.*`")
+
+
 # ==============================================================================
 # Test special checks
 # ==============================================================================
@@ -52,36 +83,51 @@ def test_check_seed_not_satisfied(non_seed):
 # ==============================================================================
 # Test general checks
 # ==============================================================================
-@pytest.mark.parametrize(
-    ("scalar", "type_"),
-    (
-        pytest.param(True, bool, id="bool"),
-        pytest.param(1, int, id="int"),
-        pytest.param(1.0, float, id="float"),
-        pytest.param(None, NoneType, id="None (NoneType)"),
-        pytest.param(None, (int, NoneType), id="None ((int, NoneType))"),
-        pytest.param(None, int | None, id="None (int | None)"),
-    ),
-)
-def test_check_scalar_type_condition_satisfied(scalar, type_):
-    assert _check_scalar(scalar, type_) == scalar
+def __type_case_id(value):
+    # Derive readable ids from the values, e.g. "1.0-(bool, int)-True"
+    if isinstance(value, tuple):
+        return f"({', '.join(map(__type_case_id, value))})"
+    return value.__name__ if isinstance(value, type) else repr(value)
 
 
 @pytest.mark.parametrize(
-    ("scalar", "type_"),
+    ("scalar", "type_", "expect_error"),
     (
-        pytest.param(True, float, id="bool vs. float"),
-        pytest.param(1, bool | float, id="int vs. bool | float"),
-        pytest.param(1.0, (bool, int), id="float vs. (bool, int)"),
-        pytest.param(1.0, NoneType, id="float vs. NoneType"),
-        pytest.param(1.0, (int, NoneType), id="float vs. (int, NoneType)"),
-        pytest.param(1.0, int | None, id="float vs. int | None"),
+        (True, bool, False),
+        (1, int, False),
+        (1.0, float, False),
+        (None, NoneType, False),
+        (None, __INT_OR_NONETYPE, False),
+        (None, __INT_OR_NONE, False),
+        (True, float, True),
+        (1, __BOOL_OR_FLOAT, True),
+        (1.0, (bool, int), True),
+        (1.0, NoneType, True),
+        (1.0, __INT_OR_NONETYPE, True),
+        (1.0, __INT_OR_NONE, True),
+        (None, int, True),
     ),
+    ids=__type_case_id,
 )
-def test_check_scalar_type_condition_not_satisfied(scalar, type_):
-    match = "`scalar` must be of type `.*`, got `.*` of type `.*`"
-    with pytest.raises(_CheckError, match=match):
-        _check_scalar(scalar, type_)
+def test_check_scalar_type_condition(scalar, type_, expect_error):
+    if expect_error:
+        match = __SCALAR_TYPE_MATCH
+        with pytest.raises(_CheckError, match=match):
+            _check_scalar(scalar, type_)
+    else:
+        assert _check_scalar(scalar, type_) == scalar
+
+
+def test_check_scalar_type_condition_not_satisfied_type_order():
+    # Equal unions with a different member order must each keep their own order
+    for type_, type_str in (
+        (int | str, "`int` or `str`"),
+        (str | int, "`str` or `int`"),
+        (Union[str, int], "`str` or `int`"),
+    ):
+        match = f"^\n  - `scalar` must be of type {type_str}, got `1.5` of type"
+        with pytest.raises(_CheckError, match=match):
+            _check_scalar(1.5, type_)
 
 
 @pytest.mark.parametrize(
@@ -91,14 +137,20 @@ def test_check_scalar_type_condition_not_satisfied(scalar, type_):
         pytest.param("zero", id="zero"),
         pytest.param(None, id="None"),
         pytest.param(lambda: 0, id="lambda: 0"),
+        pytest.param([int], id="[int]"),
     ),
 )
 def test_check_scalar_type_arg_invalid(type_):
-    match = "^`type_` must be a type, a tuple of types, or a union, got `.*`$"
+    match = __TYPE_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_scalar(0, type_)
 
 
+def test_check_scalar_type_arg_unhashable():
+    # Accepted as long as `isinstance()` accepts it (it stops at the first match)
+    assert _check_scalar(0, (object, [])) == 0
+
+
 def test_check_scalar_name_arg_valid():
     match = "`a_string` must be of type `.*`, got `.*` of type `.*`"
     with pytest.raises(_CheckError, match=match):
@@ -115,243 +167,247 @@ def test_check_scalar_name_arg_valid():
     ),
 )
 def test_check_scalar_name_arg_invalid(name):
-    match = "^`name` must be a `str`, got `.*`$"
+    match = __NAME_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_scalar(0, int, name=name)
 
 
-def __get_pytest_params(*args):
-    pytest_params = []
-    for group_params, subgroup in args:
-        for subgroup_params in subgroup:
-            op_key, op_symbol = group_params
-            scalar, type_, op_arg = subgroup_params
-
-            id_ = f"{op_key}: {scalar} {op_symbol} {op_arg}"
-            if not isinstance(scalar, type_):
-                id_ = f"{id_} (type not satisfied)"
-
-            pytest_params.append(
-                pytest.param(
-                    op_key,
-                    op_symbol,
-                    scalar,
-                    type_,
-                    op_arg,
-                    id=id_,
-                ),
-            )
+def __iter_operator_cases(cases):
+    # Yields `(op_key, op_symbol, scalar, type_, op_arg)` for each case
+    # The cases are run as subtests of a single test (instead of parametrizing it)
+    # to keep the number of collected tests small
+    # Subtests are described by their arguments, formatted only when reported
+    for (op_key, op_symbol), subgroup in cases:
+        for scalar, type_, op_arg in subgroup:
+            yield op_key, op_symbol, scalar, type_, op_arg
 
-    return pytest_params
 
-
-@pytest.mark.parametrize(
-    ("op_key", "op_symbol", "scalar", "type_", "op_arg"),
-    __get_pytest_params(
+__OPERATOR_CASES_SATISFIED = (
+    (
+        ("ge", ">="),  # (op_key, op_symbol)
         (
-            ("ge", ">="),  # (op_key, op_symbol)
-            (
-                (False, bool, False),  # (scalar, type_, op_arg)
-                (0, int, 0),
-                (0.0, float, 0.0),
-                # `op_arg` doesn't have to match type_
-                (0, int, 0.0),
-                (0.0, float, 0),
-            ),
+            (False, bool, False),  # (scalar, type_, op_arg)
+            (0, int, 0),
+            (0.0, float, 0.0),
+            # `op_arg` doesn't have to match type_
+            (0, int, 0.0),
+            (0.0, float, 0),
         ),
+    ),
+    (
+        ("gt", ">"),
         (
-            ("gt", ">"),
-            (
-                (True, bool, False),
-                (1, int, 0),
-                (1.0, float, 0.0),
-                # `op_arg` doesn't have to match type_
-                (1, int, 0.0),
-                (1.0, float, 0),
-            ),
+            (True, bool, False),
+            (1, int, 0),
+            (1.0, float, 0.0),
+            # `op_arg` doesn't have to match type_
+            (1, int, 0.0),
+            (1.0, float, 0),
         ),
+    ),
+    (
+        ("le", "<="),
         (
-            ("le", "<="),
-            (
-                (True, bool, True),
-                (1, int, 1),
-                (1.0, float, 1.0),
-                # `op_arg` doesn't have to match `type_`
-                (1, int, 1.0),
-                (1.0, float, 1),
-            ),
+            (True, bool, True),
+            (1, int, 1),
+            (1.0, float, 1.0),
+            # `op_arg` doesn't have to match `type_`
+            (1, int, 1.0),
+            (1.0, float, 1),
         ),
+    ),
+    (
+        ("lt", "<"),
         (
-            ("lt", "<"),
-            (
-                (False, bool, True),
-                (0, int, 1),
-                (0.0, float, 1.0),
-                # `op_arg` doesn't have to match `type_`
-                (0, int, 1.0),
-                (0.0, float, 1),
-            ),
+            (False, bool, True),
+            (0, int, 1),
+            (0.0, float, 1.0),
+            # `op_arg` doesn't have to match `type_`
+            (0, int, 1.0),
+            (0.0, float, 1),
         ),
+    ),
+    (
+        ("eq", "=="),
         (
-            ("eq", "=="),
-            (
-                (False, bool, False),
-                (0, int, 0),
-                (0.0, float, 0.0),
-                # `op_arg` doesn't have to match `type_`
-                (0, int, 0.0),
-                (0.0, float, 0),
-            ),
+            (False, bool, False),
+            (0, int, 0),
+            (0.0, float, 0.0),
+            # `op_arg` doesn't have to match `type_`
+            (0, int, 0.0),
+            (0.0, float, 0),
         ),
+    ),
+    (
+        ("ne", "!="),
         (
-            ("ne", "!="),
-            (
-                (False, bool, True),
-                (0, int, 1),
-                (0.0, float, 1.0),
-                # `op_arg` doesn't have to match `type_`
-                (0, int, 1.0),
-                (0.0, float, 1),
-            ),
+            (False, bool, True),
+            (0, int, 1),
+            (0.0, float, 1.0),
+            # `op_arg` doesn't have to match `type_`
+            (0, int, 1.0),
+            (0.0, float, 1),
         ),
+    ),
+    (
+        ("in_", "in"),
         (
-            ("in_", "in"),
-            (
-                (False, bool, (False, True)),
-                (0, int, (0, 1)),
-                (0.0, float, (0.0, 1.0)),
-                # `op_arg` doesn't have to match `type_`
-                (0, int, (0.0, 1.0)),
-                (0.0, float, (0, 1)),
-            ),
+            (False, bool, (False, True)),
+            (0, int, (0, 1)),
+            (0.0, float, (0.0, 1.0)),
+            # `op_arg` doesn't have to match `type_`
+            (0, int, (0.0, 1.0)),
+            (0.0, float, (0, 1)),
         ),
+    ),
+    (
+        ("not_in", "not in"),
         (
-            ("not_in", "not in"),
-            (
-                (False, bool, (True,)),
-                (-1, int, (0, 1)),
-                (-1.0, float, (0.0, 1.0)),
-                # `op_arg` doesn't have to match `type_`
-                (-1, int, (0.0, 1.0)),
-                (-1.0, float, (0, 1)),
-            ),
+            (False, bool, (True,)),
+            (-1, int, (0, 1)),
+            (-1.0, float, (0.0, 1.0)),
+            # `op_arg` doesn't have to match `type_`
+            (-1, int, (0.0, 1.0)),
+            (-1.0, float, (0, 1)),
         ),
     ),
 )
-def test_check_scalar_operator_condition_satisfied(
-    op_key, op_symbol, scalar, type_, op_arg
-):
-    assert _check_scalar(scalar, type_, **{op_key: op_arg}) == scalar
 
 
-@pytest.mark.parametrize(
-    ("op_key", "op_symbol", "scalar", "type_", "op_arg"),
-    __get_pytest_params(
+def test_check_scalar_operator_condition_satisfied(subtests):
+    for op_key, op_symbol, scalar, type_, op_arg in __iter_operator_cases(
+        __OPERATOR_CASES_SATISFIED
+    ):
+        with subtests.test(op_key=op_key, scalar=scalar, type_=type_, op_arg=op_arg):
+            assert _check_scalar(scalar, type_, **{op_key: op_arg}) == scalar
+
+
+__OPERATOR_CASES_NOT_SATISFIED = (
+    (
+        ("ge", ">="),  # (op_key, op_symbol)
         (
-            ("ge", ">="),  # (op_key, op_symbol)
-            (
-                (False, bool, True),  # (scalar, type_, op_arg)
-                (0, int, 1),
-                (0.0, float, 1.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (0.0, int, 1),
-                (0, float, 1.0),
-            ),
+            (False, bool, True),  # (scalar, type_, op_arg)
+            (0, int, 1),
+            (0.0, float, 1.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (0.0, int, 1),
+            (0, float, 1.0),
         ),
+    ),
+    (
+        ("gt", ">"),
         (
-            ("gt", ">"),
-            (
-                (False, bool, False),
-                (0, int, 0),
-                (0.0, float, 0.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (0.0, int, 0),
-                (0, float, 0.0),
-            ),
+            (False, bool, False),
+            (0, int, 0),
+            (0.0, float, 0.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (0.0, int, 0),
+            (0, float, 0.0),
         ),
+    ),
+    (
+        ("le", "<="),
         (
-            ("le", "<="),
-            (
-                (True, bool, False),
-                (1, int, 0),
-                (1.0, float, 0.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (1.0, int, 0),
-                (1, float, 0.0),
-            ),
+            (True, bool, False),
+            (1, int, 0),
+            (1.0, float, 0.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (1.0, int, 0),
+            (1, float, 0.0),
         ),
+    ),
+    (
+        ("lt", "<"),
         (
-            ("lt", "<"),
-            (
-                (True, bool, True),
-                (1, int, 1),
-                (1.0, float, 1.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (1.0, int, 1),
-                (1, float, 1.0),
-            ),
+            (True, bool, True),
+            (1, int, 1),
+            (1.0, float, 1.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (1.0, int, 1),
+            (1, float, 1.0),
         ),
+    ),
+    (
+        ("eq", "=="),
         (
-            ("eq", "=="),
-            (
-                (False, bool, True),
-                (0, int, 1),
-                (0.0, float, 1.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (0.0, int, 1),
-                (0, float, 1.0),
-            ),
+            (False, bool, True),
+            (0, int, 1),
+            (0.0, float, 1.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (0.0, int, 1),
+            (0, float, 1.0),
         ),
+    ),
+    (
+        ("ne", "!="),
         (
-            ("ne", "!="),
-            (
-                (False, bool, False),
-                (0, int, 0),
-                (0.0, float, 0.0),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (0.0, int, 0),
-                (0, float, 0.0),
-            ),
+            (False, bool, False),
+            (0, int, 0),
+            (0.0, float, 0.0),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (0.0, int, 0),
+            (0, float, 0.0),
         ),
+    ),
+    (
+        ("in_", "in"),
         (
-            ("in_", "in"),
-            (
-                (False, bool, (True,)),
-                (-1, int, (0, 1)),
-                (-1.0, float, (0.0, 1.0)),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (-1.0, int, (0, 1)),
-                (-1, float, (0.0, 1.0)),
-            ),
+            (False, bool, (True,)),
+            (-1, int, (0, 1)),
+            (-1.0, float, (0.0, 1.0)),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (-1.0, int, (0, 1)),
+            (-1, float, (0.0, 1.0)),
         ),
+    ),
+    (
+        ("not_in", "not in"),
         (
-            ("not_in", "not in"),
-            (
-                (False, bool, (False, True)),
-                (0, int, (0, 1)),
-                (0.0, float, (0.0, 1.0)),
-                # `scalar` doesn't have to match `type_`, but the error will be listed
-                (0.0, int, (0, 1)),
-                (0, float, (0.0, 1.0)),
-            ),
+            (False, bool, (False, True)),
+            (0, int, (0, 1)),
+            (0.0, float, (0.0, 1.0)),
+            # `scalar` doesn't have to match `type_`, but the error will be listed
+            (0.0, int, (0, 1)),
+            (0, float, (0.0, 1.0)),
         ),
     ),
 )
-def test_check_scalar_operator_condition_not_satisfied(
-    op_key, op_symbol, scalar, type_, op_arg
-):
-    if isinstance(scalar, type_):
-        match = "^\n  - `scalar .{1,6} .*` not satisfied, got `.*`$"
-    else:
-        match = (
-            "^\n  - `scalar` must be of type `.*`, got `.*` of type `.*`\n"
-            "  - `scalar .{1,6} .*` not satisfied, got `.*`$"
-        )
-    match = match.replace("(", "\\(")
-    match = match.replace(")", "\\)")
 
-    with pytest.raises(_CheckError, match=match):
-        _check_scalar(scalar, type_, **{op_key: op_arg})
+
+__OPERATOR_NOT_SATISFIED_MATCH = re.compile(
+    "^\n  - `scalar .{1,6} .*` not satisfied, got `.*`$"
+)
+__TYPE_AND_OPERATOR_NOT_SATISFIED_MATCH = re.compile(
+    "^\n  - `scalar` must be of type `.*`, got `.*` of type `.*`\n"
+    "  - `scalar .{1,6} .*` not satisfied, got `.*`$"
+)
+
+
+# Holds `(op_key, scalar, type_, op_arg, match)` for each case, with `match`
+# chosen once by whether `scalar` also violates `type_`
+__OPERATOR_CASES_NOT_SATISFIED_MATCHES = tuple(
+    (
+        op_key,
+        scalar,
+        type_,
+        op_arg,
+        (
+            __OPERATOR_NOT_SATISFIED_MATCH
+            if isinstance(scalar, type_)
+            else __TYPE_AND_OPERATOR_NOT_SATISFIED_MATCH
+        ),
+    )
+    for op_key, _, scalar, type_, op_arg in __iter_operator_cases(
+        __OPERATOR_CASES_NOT_SATISFIED
+    )
+)
+
+
+def test_check_scalar_operator_condition_not_satisfied(subtests):
+    for op_key, scalar, type_, op_arg, match in __OPERATOR_CASES_NOT_SATISFIED_MATCHES:
+        with subtests.test(op_key=op_key, scalar=scalar, type_=type_, op_arg=op_arg):
+            with pytest.raises(_CheckError, match=match):
+                _check_scalar(scalar, type_, **{op_key: op_arg})
 
 
 @pytest.mark.parametrize(
@@ -367,11 +423,9 @@ def test_check_scalar_operator_condition_not_satisfied(
 )
 def test_check_scalar_operator_arg_invalid(op_key, op_symbol, scalar, type_, op_arg):
     if op_key in ("ge", "gt", "le", "lt"):
-        match = (
-            "^`.{1,6}` \\(`.{2,6}`\\) not supported between instances of `.*` and `.*`"
-        )
+        match = __OPERATOR_NOT_SUPPORTED_MATCH
     elif op_key in ("in_", "not_in"):
-        match = "^`.{2,6}` must be iterable, got `.*`"
+        match = __OPERATOR_NOT_ITERABLE_MATCH
     else:
         match = ""
 
@@ -380,70 +434,92 @@ def test_check_scalar_operator_arg_invalid(op_key, op_symbol, scalar, type_, op_
 
 
 def test_check_scalar_operator_unsupported():
-    match = "^unsupported operator keyword\\(s\\) `foo`, `bar`"
-    operators = OrderedDict([("foo", 0), ("ge", 1), ("bar", 2), ("lt", 3)])
+    match = __OPERATORS_UNSUPPORTED_MATCH
+    operators = {"foo": 0, "ge": 1, "bar": 2, "lt": 3}
 
     with pytest.raises(TypeError, match=match):
         _check_scalar(0, int, **operators)
 
 
-@pytest.mark.parametrize(
-    ("op_key", "op_symbol", "scalar", "type_", "op_arg"),
-    __get_pytest_params(
+__OPERATOR_CASES_NOT_APPLICABLE_TO_SCALAR = (
+    (
+        ("ge", ">="),  # (op_key, op_symbol)
         (
-            ("ge", ">="),  # (op_key, op_symbol)
-            (
-                (1j, complex, 0),  # (scalar, type_, op_arg)
-                (1j, int, 0),
-            ),
+            (1j, complex, 0),  # (scalar, type_, op_arg)
+            (1j, int, 0),
         ),
+    ),
+    (
+        ("gt", ">"),
         (
-            ("gt", ">"),
-            (
-                (1j, complex, 0),
-                (1j, int, 0),
-            ),
+            (1j, complex, 0),
+            (1j, int, 0),
         ),
+    ),
+    (
+        ("le", "<="),
         (
-            ("le", "<="),
-            (
-                (1j, complex, 0),
-                (1j, int, 0),
-            ),
+            (1j, complex, 0),
+            (1j, int, 0),
         ),
+    ),
+    (
+        ("lt", "<"),
         (
-            ("lt", "<"),
-            (
-                (1j, complex, 0),
-                (1j, int, 0),
-            ),
+            (1j, complex, 0),
+            (1j, int, 0),
         ),
     ),
 )
-def test_check_scalar_operator_not_applicable_to_scalar(
-    op_key,
-    op_symbol,
-    scalar,
-    type_,
-    op_arg,
-):
-    if isinstance(scalar, type_):
-        error = TypeError
-        if op_key in ("ge", "gt", "le", "lt"):
-            match = (
-                "^`.{1,6}` \\(`.{2,6}`\\) not supported between instances "
-                "of `.*` and `.*`"
-            )
-        elif op_key in ("in_", "not_in"):
-            match = "^`.{2,6}` must be iterable, got `.*`"
-        else:
-            match = ""
-    else:
-        error = _CheckError
-        match = "`scalar` must be of type `.*`, got `.*` of type `.*`"
 
-    with pytest.raises(error, match=match):
-        _check_scalar(scalar, type_, **{op_key: op_arg})
+
+def test_check_scalar_operator_not_applicable_to_scalar(subtests):
+    for op_key, op_symbol, scalar, type_, op_arg in __iter_operator_cases(
+        __OPERATOR_CASES_NOT_APPLICABLE_TO_SCALAR
+    ):
+        with subtests.test(op_key=op_key, scalar=scalar, type_=type_, op_arg=op_arg):
+            if isinstance(scalar, type_):
+                error = TypeError
+                if op_key in ("ge", "gt", "le", "lt"):
+                    match = __OPERATOR_NOT_SUPPORTED_MATCH
+                elif op_key in ("in_", "not_in"):
+                    match = __OPERATOR_NOT_ITERABLE_MATCH
+                else:
+                    match = ""
+            else:
+                error = _CheckError
+                match = __SCALAR_TYPE_MATCH
+
+            with pytest.raises(error, match=match):
+                _check_scalar(scalar, type_, **{op_key: op_arg})
+
+
+def test_make_check_scalar_satisfied():
+    check_scalar = _make_check_scalar(int | None, name="n", ge=0, lt=3)
+    for scalar in (None, 0, 1, 2):
+        assert check_scalar(scalar) == scalar
+
+
+def test_make_check_scalar_not_satisfied():
+    check_scalar = _make_check_scalar(int | None, name="n", ge=0, lt=3)
+    match = "^\n  - `n` must be of type `.*`, got `.*` of type `.*`$"
+    with pytest.raises(_CheckError, match=match):
+        check_scalar(1.0)
+    match = "^\n  - `n < 3` not satisfied, got `3`$"
+    with pytest.raises(_CheckError, match=match):
+        check_scalar(3)
+
+
+def test_make_check_scalar_args_invalid():
+    match = __TYPE_ARG_INVALID_MATCH
+    with pytest.raises(TypeError, match=match):
+        _make_check_scalar(0)
+    match = __NAME_ARG_INVALID_MATCH
+    with pytest.raises(TypeError, match=match):
+        _make_check_scalar(int, name=0)
+    match = "^unsupported operator keyword\\(s\\) `foo`"
+    with pytest.raises(TypeError, match=match):
+        _make_check_scalar(int, foo=0)
 
 
 @pytest.mark.parametrize(
@@ -457,7 +533,7 @@ def test_check_scalar_operator_not_applicable_to_scalar(
     ),
 )
 def test_check_sequence_sequence_arg_invalid(sequence):
-    match = "`sequence` must be a sequence with elements of type `.*`, got `.*`"
+    match = __SEQUENCE_TYPE_MATCH
     with pytest.raises(_CheckError, match=match):
         _check_sequence(sequence, int)
 
@@ -469,8 +545,8 @@ def test_check_sequence_sequence_arg_invalid(sequence):
         pytest.param([1, 2, 3], int, id="int"),
         pytest.param([1.0, 2.0, 3.0], float, id="float"),
         pytest.param([None, None], NoneType, id="None (NoneType)"),
-        pytest.param([None, 1], (int, NoneType), id="None (int, NoneType)"),
-        pytest.param([None, 1], int | None, id="None (int | None)"),
+        pytest.param([None, 1], __INT_OR_NONETYPE, id="None (int, NoneType)"),
+        pytest.param([None, 1], __INT_OR_NONE, id="None (int | None)"),
     ),
 )
 def test_check_sequence_type_condition_satisfied(sequence, type_):
@@ -484,12 +560,12 @@ def test_check_sequence_type_condition_satisfied(sequence, type_):
         pytest.param([1.0, 2, 3], int, id="float vs. int"),
         pytest.param([1, 2.0, 3.0], float, id="int vs. float"),
         pytest.param([1.0, 2.0], NoneType, id="float vs. NoneType"),
-        pytest.param([1.0, 2.0], (int, NoneType), id="float vs. (int, NoneType)"),
-        pytest.param([1.0, 2.0], int | None, id="float vs. int | None"),
+        pytest.param([1.0, 2.0], __INT_OR_NONETYPE, id="float vs. (int, NoneType)"),
+        pytest.param([1.0, 2.0], __INT_OR_NONE, id="float vs. int | None"),
     ),
 )
 def test_check_sequence_type_condition_not_satisfied(sequence, type_):
-    match = "`sequence` must be a sequence with elements of type `.*`, got `.*`"
+    match = __SEQUENCE_TYPE_MATCH
     with pytest.raises(_CheckError, match=match):
         _check_sequence(sequence, type_)
 
@@ -504,7 +580,7 @@ def test_check_sequence_type_condition_not_satisfied(sequence, type_):
     ),
 )
 def test_check_sequence_type_arg_invalid(type_):
-    match = "^`type_` must be a type, a tuple of types, or a union, got `.*`$"
+    match = __TYPE_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_sequence((1, 2, 3), type_)
 
@@ -525,7 +601,7 @@ def test_check_sequence_name_arg_valid():
     ),
 )
 def test_check_sequence_name_arg_invalid(name):
-    match = "^`name` must be a `str`, got `.*`$"
+    match = __NAME_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_sequence((1, 2, 3), int, name=name)
 
@@ -559,90 +635,19 @@ def test_check_sequence_length_condition_not_satisfied():
     ),
 )
 def test_check_sequence_length_arg_invalid(length):
-    match = "^`length` must be a positive `int` or `None`, got `.*`$"
+    match = __LENGTH_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_sequence((1, 2, 3), int, length=length)
 
 
 def test_check_sequence_operator_unsupported():
-    match = "^unsupported operator keyword\\(s\\) `foo`, `bar`"
-    operators = OrderedDict([("foo", 0), ("ge", 1), ("bar", 2), ("lt", 3)])
+    match = __OPERATORS_UNSUPPORTED_MATCH
+    operators = {"foo": 0, "ge": 1, "bar": 2, "lt": 3}
 
     with pytest.raises(TypeError, match=match):
         _check_sequence((1, 2, 3), int, **operators)
 
 
-@pytest.mark.parametrize(
-    ("sequence", "type_", "length", "operators", "match"),
-    (
-        pytest.param(
-            (False, True, 2, 3.0),
-            bool,
-            4,
-            {"le": True},
-            (
-                "^\n  - `s` must be a sequence with elements of type `.*`, got .*\n"
-                "  - `s\\[2\\]` must be of type `bool`, got .*\n"
-                "  - `s\\[2\\] <= True` not satisfied, got .*\n"
-                "  - `s\\[3\\]` must be of type `bool`, got .*\n"
-                "  - `s\\[3] <= True` not satisfied, got"
-            ),
-            id="scenario0",
-        ),
-        pytest.param(
-            (False, 1, 2, 3.0),
-            int,
-            4,
-            {"ge": 1},
-            (
-                "^\n  - `s` must be a sequence with elements of type `.*`, got .*\n"
-                "  - `s\\[0\\] >= 1` not satisfied, got .*\n"
-                "  - `s\\[3\\]` must be of type `int`, got"
-            ),
-            id="scenario1",
-        ),
-        pytest.param(
-            (0.0, True, 2.0, 3.0),
-            float,
-            5,
-            {"gt": 0.0, "lt": 3.0},
-            (
-                "^\n  - `s` must be a sequence with elements of type `.*`, got .*\n"
-                "  - `s` must have length `5`, but .*\n"
-                "  - `s\\[0\\] > 0.0` not satisfied, got .*\n"
-                "  - `s\\[1\\]` must be of type `float`, got .*\n"
-                "  - `s\\[3\\] < 3.0` not satisfied"
-            ),
-            id="scenario2",
-        ),
-        pytest.param(
-            (0, 1j, 2j, 3j, 4j, 5),
-            complex,
-            5,
-            {"not_in": (2j, 4j)},
-            (
-                "^\n  - `s` must be a sequence with elements of type `.*`, got .*\n"
-                "  - `s` must have length `5`, but .*\n"
-                "  - `s\\[0\\]` must be of type `complex`, got .*\n"
-                "  - `s\\[2\\] not in \\(2j, 4j\\)` not satisfied, got .*\n"
-                "  - `s\\[4\\] not in \\(2j, 4j\\)` not satisfied, got .*\n"
-                "  - `s\\[5\\]` must be of type `complex`, got"
-            ),
-            id="scenario3",
-        ),
-    ),
-)
-def test_check_sequence_with_multiple_conditions(
-    sequence,
-    type_,
-    length,
-    operators,
-    match,
-):
-    with pytest.raises(_CheckError, match=match):
-        _check_sequence(sequence, type_, name="s", length=length, **operators)
-
-
 @pytest.mark.parametrize(
     "scalar_or_sequence",
     (
@@ -651,7 +656,7 @@ def test_check_sequence_with_multiple_conditions(
     ),
 )
 def test_check_scalar_or_sequence_arg_invalid(scalar_or_sequence):
-    match = "`scalar_or_sequence` must be of type `.*`, or a sequence"
+    match = __SCALAR_OR_SEQUENCE_TYPE_MATCH
     with pytest.raises(_CheckError, match=match):
         _check_scalar_or_sequence(scalar_or_sequence, int)
 
@@ -666,11 +671,11 @@ def test_check_scalar_or_sequence_arg_invalid(scalar_or_sequence):
         pytest.param([1, 2, 3], int, id="sequence of int"),
         pytest.param([1.0, 2.0, 3.0], float, id="sequence of float"),
         pytest.param(None, NoneType, id="None (NoneType)"),
-        pytest.param(None, (int, NoneType), id="None ((int, NoneType))"),
-        pytest.param(None, int | None, id="None (int | None)"),
+        pytest.param(None, __INT_OR_NONETYPE, id="None ((int, NoneType))"),
+        pytest.param(None, __INT_OR_NONE, id="None (int | None)"),
         pytest.param([None, None], NoneType, id="None (NoneType)"),
-        pytest.param([None, 1], (int, NoneType), id="None (int, NoneType)"),
-        pytest.param([None, 1], int | None, id="None (int | None)"),
+        pytest.param([None, 1], __INT_OR_NONETYPE, id="None (int, NoneType)"),
+        pytest.param([None, 1], __INT_OR_NONE, id="None (int | None)"),
     ),
 )
 def test_check_scalar_or_sequence_type_condition_satisfied(scalar_or_sequence, type_):
@@ -687,17 +692,17 @@ def test_check_scalar_or_sequence_type_condition_satisfied(scalar_or_sequence, t
         pytest.param([1.0, 2, 3], int, id="sequence of int"),
         pytest.param([1, 2.0, 3.0], float, id="sequence of float"),
         pytest.param(1.0, NoneType, id="float vs. NoneType"),
-        pytest.param(1.0, (int, NoneType), id="float vs. (int, NoneType)"),
-        pytest.param(1.0, int | None, id="float vs. int | None"),
+        pytest.param(1.0, __INT_OR_NONETYPE, id="float vs. (int, NoneType)"),
+        pytest.param(1.0, __INT_OR_NONE, id="float vs. int | None"),
         pytest.param([1.0, 2.0], NoneType, id="float vs. NoneType"),
-        pytest.param([1.0, 2.0], (int, NoneType), id="float vs. (int, NoneType)"),
-        pytest.param([1.0, 2.0], int | None, id="float vs. int | None"),
+        pytest.param([1.0, 2.0], __INT_OR_NONETYPE, id="float vs. (int, NoneType)"),
+        pytest.param([1.0, 2.0], __INT_OR_NONE, id="float vs. int | None"),
     ),
 )
 def test_check_scalar_or_sequence_type_condition_not_satisfied(
     scalar_or_sequence, type_
 ):
-    match = "`scalar_or_sequence` must be of type `.*`, or a sequence"
+    match = __SCALAR_OR_SEQUENCE_TYPE_MATCH
     with pytest.raises(_CheckError, match=match):
         _check_scalar_or_sequence(scalar_or_sequence, type_)
 
@@ -712,7 +717,7 @@ def test_check_scalar_or_sequence_type_condition_not_satisfied(
     ),
 )
 def test_check_scalar_or_sequence_type_arg_invalid(type_):
-    match = "^`type_` must be a type, a tuple of types, or a union, got `.*`$"
+    match = __TYPE_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_scalar_or_sequence(0, type_)
     with pytest.raises(TypeError, match=match):
@@ -735,7 +740,7 @@ def test_check_scalar_or_sequence_name_arg_valid():
     ),
 )
 def test_check_scalar_or_sequence_name_arg_invalid(name):
-    match = "^`name` must be a `str`, got `.*`$"
+    match = __NAME_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_scalar_or_sequence(0, int, name=name)
     with pytest.raises(TypeError, match=match):
@@ -776,14 +781,14 @@ def test_scalar_or_sequence_length_condition_not_satisfied():
     ),
 )
 def test_check_scalar_or_sequence_length_arg_invalid(length):
-    match = "^`length` must be a positive `int` or `None`, got `.*`$"
+    match = __LENGTH_ARG_INVALID_MATCH
     with pytest.raises(TypeError, match=match):
         _check_scalar_or_sequence((1, 2, 3), int, length=length)
 
 
 def test_check_scalar_or_sequence_operator_unsupported():
-    match = "^unsupported operator keyword\\(s\\) `foo`, `bar`"
-    operators = OrderedDict([("foo", 0), ("ge", 1), ("bar", 2), ("lt", 3)])
+    match = __OPERATORS_UNSUPPORTED_MATCH
+    operators = {"foo": 0, "ge": 1, "bar": 2, "lt": 3}
 
     with pytest.raises(TypeError, match=match):
         _check_scalar_or_sequence(0, int, **operators)
@@ -792,79 +797,112 @@ def test_check_scalar_or_sequence_operator_unsupported():
         _check_scalar_or_sequence((1, 2, 3), int, **operators)
 
 
-@pytest.mark.parametrize(
-    ("scalar_or_sequence", "type_", "length", "operators", "match"),
+# ==============================================================================
+# Test sequence and scalar or sequence checks with multiple conditions
+# ==============================================================================
+# The match of the type condition depends on the check, the rest is shared
+__TYPE_CONDITION_MATCHES: dict[Callable[..., Any], str] = {
+    _check_sequence: (
+        "^\n  - `x` must be a sequence with elements of type `.*`, got .*\n"
+    ),
+    _check_scalar_or_sequence: (
+        "^\n  - `x` must be of type `.*`, or a sequence with elements of type `.*`, "
+        "got .*\n"
+    ),
+}
+
+# (checks, value, type_, length, operators, match without the type condition)
+__MULTIPLE_CONDITIONS_SCENARIOS = (
     (
-        pytest.param(
-            (False, True, 2, 3.0),
-            bool,
-            4,
-            {"le": True},
-            (
-                "^\n  - `sos` must be of type `.*`, or a sequence with "
-                "elements of type `.*`, got .*\n"
-                "  - `sos\\[2\\]` must be of type `bool`, got .*\n"
-                "  - `sos\\[2\\] <= True` not satisfied, got .*\n"
-                "  - `sos\\[3\\]` must be of type `bool`, got .*\n"
-                "  - `sos\\[3] <= True` not satisfied, got"
-            ),
-            id="scenario0",
+        (_check_sequence, _check_scalar_or_sequence),
+        (False, True, 2, 3.0),
+        bool,
+        4,
+        {"le": True},
+        (
+            "  - `x\\[2\\]` must be of type `bool`, got .*\n"
+            "  - `x\\[2\\] <= True` not satisfied, got .*\n"
+            "  - `x\\[3\\]` must be of type `bool`, got .*\n"
+            "  - `x\\[3] <= True` not satisfied, got"
         ),
-        pytest.param(
-            (False, 1, 2, 3.0),
-            int,
-            4,
-            {"ge": 1},
-            (
-                "^\n  - `sos` must be of type `.*`, or a sequence with "
-                "elements of type `.*`, got .*\n"
-                "  - `sos\\[0\\] >= 1` not satisfied, got .*\n"
-                "  - `sos\\[3\\]` must be of type `int`, got"
-            ),
-            id="scenario1",
+    ),
+    (
+        (_check_sequence, _check_scalar_or_sequence),
+        (False, 1, 2, 3.0),
+        int,
+        4,
+        {"ge": 1},
+        (
+            "  - `x\\[0\\] >= 1` not satisfied, got .*\n"
+            "  - `x\\[3\\]` must be of type `int`, got"
         ),
-        pytest.param(
-            (0.0, True, 2.0, 3.0),
-            float,
-            5,
-            {"gt": 0.0, "lt": 3.0},
-            (
-                "^\n  - `sos` must be of type `.*`, or a sequence with "
-                "elements of type `.*`, got .*\n"
-                "  - `sos` must have length `5`, but .*\n"
-                "  - `sos\\[0\\] > 0.0` not satisfied, got .*\n"
-                "  - `sos\\[1\\]` must be of type `float`, got .*\n"
-                "  - `sos\\[3\\] < 3.0` not satisfied"
-            ),
-            id="scenario2",
+    ),
+    (
+        (_check_sequence, _check_scalar_or_sequence),
+        (0.0, True, 2.0, 3.0),
+        float,
+        5,
+        {"gt": 0.0, "lt": 3.0},
+        (
+            "  - `x` must have length `5`, but .*\n"
+            "  - `x\\[0\\] > 0.0` not satisfied, got .*\n"
+            "  - `x\\[1\\]` must be of type `float`, got .*\n"
+            "  - `x\\[3\\] < 3.0` not satisfied"
         ),
-        pytest.param(
-            0,
-            float,
-            None,
-            {"gt": 1.0, "in_": (1, 2, 3)},
-            (
-                "^\n  - `sos` must be of type `.*`, or a sequence with "
-                "elements of type `.*`, got .*\n"
-                "  - `sos > 1.0` not satisfied, got .*\n"
-                "  - `sos in \\(1, 2, 3\\)` not satisfied, got"
-            ),
-            id="scenario3",
+    ),
+    (
+        (_check_sequence, _check_scalar_or_sequence),
+        (0, 1j, 2j, 3j, 4j, 5),
+        complex,
+        5,
+        {"not_in": (2j, 4j)},
+        (
+            "  - `x` must have length `5`, but .*\n"
+            "  - `x\\[0\\]` must be of type `complex`, got .*\n"
+            "  - `x\\[2\\] not in \\(2j, 4j\\)` not satisfied, got .*\n"
+            "  - `x\\[4\\] not in \\(2j, 4j\\)` not satisfied, got .*\n"
+            "  - `x\\[5\\]` must be of type `complex`, got"
+        ),
+    ),
+    (
+        (_check_scalar_or_sequence,),
+        0,
+        float,
+        None,
+        {"gt": 1.0, "in_": (1, 2, 3)},
+        (
+            "  - `x > 1.0` not satisfied, got .*\n"
+            "  - `x in \\(1, 2, 3\\)` not satisfied, got"
         ),
     ),
 )
-def test_check_scalar_or_sequence_with_multiple_conditions(
-    scalar_or_sequence,
+
+
+@pytest.mark.parametrize(
+    ("check", "value", "type_", "length", "operators", "match"),
+    tuple(
+        pytest.param(
+            check,
+            value,
+            type_,
+            length,
+            operators,
+            f"{__TYPE_CONDITION_MATCHES[check]}{match}",
+            id=f"{check.__name__}-scenario{index}",
+        )
+        for index, (checks, value, type_, length, operators, match) in enumerate(
+            __MULTIPLE_CONDITIONS_SCENARIOS
+        )
+        for check in checks
+    ),
+)
+def test_check_with_multiple_conditions(
+    check,
+    value,
     type_,
     length,
     operators,
     match,
 ):
     with pytest.raises(_CheckError, match=match):
-        _check_scalar_or_sequence(
-            scalar_or_sequence,
-            type_,
-            name="sos",
-            length=length,
-            **operators,
-        )
+        check(value, type_, name="x", length=length, **operators)
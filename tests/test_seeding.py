@@ -11,133 +11,162 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import operator
 import random
+import re
+from typing import Any
 
 import numpy as np
 import pytest
 import torch
 
 from renda._exceptions import _CheckError
-from renda.seeding import temp_seed
+from renda.seeding import MAX_SEED, MIN_SEED, temp_seed
 
 
-@pytest.mark.parametrize(
-    (
-        "set_global_seed",
-        "get_10_random_numbers",
-        "all_equal",
+_CUDA_IS_AVAILABLE = torch.cuda.is_available()
+_CUDA_DEVICE = torch.device("cuda")
+
+
+def _get_10_random_numbers_random():
+    return [random.random() for _ in range(10)]
+
+
+def _get_10_random_numbers_numpy():
+    return np.random.rand(10)
+
+
+def _get_10_random_numbers_torch():
+    return torch.rand(10)
+
+
+def _get_10_random_numbers_torch_cuda():
+    return torch.rand(10, device=_CUDA_DEVICE)
+
+
+_TEMP_SEED_PARAMS: tuple[Any, ...] = (
+    pytest.param(
+        random.seed,
+        _get_10_random_numbers_random,
+        operator.eq,
+        id="random",
     ),
-    (
-        pytest.param(
-            random.seed,
-            lambda: [random.random() for _ in range(10)],
-            lambda a, b: a == b,
-            id="random",
-        ),
-        pytest.param(
-            np.random.seed,
-            lambda: np.random.rand(10),
-            lambda a, b: np.all(a == b),
-            id="numpy",
-        ),
-        pytest.param(
-            torch.manual_seed,
-            lambda: torch.rand(10),
-            lambda a, b: torch.all(torch.eq(a, b)),
-            id="torch",
-        ),
+    pytest.param(
+        np.random.seed,
+        _get_10_random_numbers_numpy,
+        np.array_equal,
+        id="numpy",
+    ),
+    pytest.param(
+        torch.manual_seed,
+        _get_10_random_numbers_torch,
+        torch.equal,
+        id="torch",
+    ),
+)
+if _CUDA_IS_AVAILABLE:
+    # Only generated where CUDA is available
+    _TEMP_SEED_PARAMS += (
         pytest.param(
-            torch.cuda.manual_seed_all,
-            lambda: torch.rand(10, device=torch.device("cuda")),
-            lambda a, b: torch.all(torch.eq(a, b)),
+            # Only the current CUDA device is drawn from (no need to seed all devices)
+            torch.cuda.manual_seed,
+            _get_10_random_numbers_torch_cuda,
+            torch.equal,
             id="torch_cuda",
-            marks=pytest.mark.skipif(
-                not torch.cuda.is_available(),
-                reason="requires torch with CUDA support",
-            ),
         ),
-    ),
-)
-class TestTempSeed:
-    def test_same_seeds(
-        self,
-        set_global_seed,
-        get_10_random_numbers,
-        all_equal,
-    ):
-        set_global_seed(42)
-        with temp_seed(0):
-            a = get_10_random_numbers()
-        with temp_seed(0):
-            b = get_10_random_numbers()
+    )
 
-        assert all_equal(a, b)
 
-    def test_different_seeds(
-        self,
-        set_global_seed,
-        get_10_random_numbers,
-        all_equal,
-    ):
-        set_global_seed(42)
-        with temp_seed(0):
-            a = get_10_random_numbers()
-        with temp_seed(1):
-            b = get_10_random_numbers()
-
-        assert not all_equal(a, b)
-
-    def test_none_as_seed(
-        self,
-        set_global_seed,
-        get_10_random_numbers,
-        all_equal,
-    ):
-        set_global_seed(42)
+# Scenarios of the `temp_seed` contract, each entered with the global random
+# number generators seeded to 42
+def _same_seeds(set_global_seed, get_10_random_numbers, all_equal):
+    with temp_seed(0):
         a = get_10_random_numbers()
+    with temp_seed(0):
+        b = get_10_random_numbers()
 
-        set_global_seed(42)
-        with temp_seed(None):
-            b = get_10_random_numbers()
+    assert all_equal(a, b)
 
-        assert all_equal(a, b)
 
-    def test_independence_of_nested_calls(
-        self,
-        set_global_seed,
-        get_10_random_numbers,
-        all_equal,
-    ):
-        set_global_seed(42)
-        with temp_seed(0):
-            a1 = get_10_random_numbers()
-            with temp_seed(0):
-                b1 = get_10_random_numbers()
-                b2 = get_10_random_numbers()
-            a2 = get_10_random_numbers()
-
-        assert all_equal(a1, b1)
-        assert all_equal(a2, b2)
-
-    def test_independence_of_global_rng(
-        self,
-        set_global_seed,
-        get_10_random_numbers,
-        all_equal,
-    ):
-        set_global_seed(42)
-        get_10_random_numbers()
+def _different_seeds(set_global_seed, get_10_random_numbers, all_equal):
+    with temp_seed(0):
         a = get_10_random_numbers()
+    with temp_seed(1):
+        b = get_10_random_numbers()
 
-        set_global_seed(42)
-        get_10_random_numbers()
-        with temp_seed(0):
-            get_10_random_numbers()
+    assert not all_equal(a, b)
+
+
+def _none_as_seed(set_global_seed, get_10_random_numbers, all_equal):
+    a = get_10_random_numbers()
+
+    set_global_seed(42)
+    with temp_seed(None):
         b = get_10_random_numbers()
 
-        assert all_equal(a, b)
+    assert all_equal(a, b)
+
+
+def _independence_of_nested_calls(set_global_seed, get_10_random_numbers, all_equal):
+    with temp_seed(0):
+        a1 = get_10_random_numbers()
+        with temp_seed(0):
+            b1 = get_10_random_numbers()
+            b2 = get_10_random_numbers()
+        a2 = get_10_random_numbers()
+
+    assert all_equal(a1, b1)
+    assert all_equal(a2, b2)
+
+
+def _independence_of_global_rng(set_global_seed, get_10_random_numbers, all_equal):
+    get_10_random_numbers()
+    a = get_10_random_numbers()
+
+    set_global_seed(42)
+    get_10_random_numbers()
+    with temp_seed(0):
+        get_10_random_numbers()
+    b = get_10_random_numbers()
+
+    assert all_equal(a, b)
+
+
+_TEMP_SEED_SCENARIOS = (
+    _same_seeds,
+    _different_seeds,
+    _none_as_seed,
+    _independence_of_nested_calls,
+    _independence_of_global_rng,
+)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    _TEMP_SEED_SCENARIOS,
+    ids=lambda scenario: scenario.__name__,
+)
+@pytest.mark.parametrize(
+    (
+        "set_global_seed",
+        "get_10_random_numbers",
+        "all_equal",
+    ),
+    _TEMP_SEED_PARAMS,
+)
+def test_temp_seed(scenario, set_global_seed, get_10_random_numbers, all_equal):
+    set_global_seed(42)
+    scenario(set_global_seed, get_10_random_numbers, all_equal)
+
+
+# Matches any of the seed error messages (with the bounds taken literally)
+_SEED_ARG_INVALID_MATCH = re.compile(
+    "^\n  - `seed` must be of type `int` or `NoneType`, got `.*` of type `.*`$"
+    f"|^\n  - `seed >= {re.escape(str(MIN_SEED))}` not satisfied, got `.*`$"
+    f"|^\n  - `seed <= {re.escape(str(MAX_SEED))}` not satisfied, got `.*`$"
+)
 
 
 def test_temp_seed_seed_arg_invalid(non_seed):
-    with pytest.raises(_CheckError):
+    with pytest.raises(_CheckError, match=_SEED_ARG_INVALID_MATCH):
         temp_seed(non_seed)